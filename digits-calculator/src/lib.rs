@@ -1,4 +1,10 @@
+use numpy::ndarray::Array2;
+use numpy::{
+    IntoPyArray, PyArray1, PyArray2, PyReadonlyArray1, PyReadonlyArray2, PyUntypedArrayMethods,
+};
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 
 mod math;
 
@@ -8,10 +14,17 @@ mod math;
 
 /// Calculates an approximation of Pi using the Leibniz formula.
 #[pyfunction]
+#[pyo3(signature = (iterations, /))]
 fn calculate_pi(iterations: u32) -> PyResult<f64> {
     Ok(math::calculate_pi(iterations))
 }
 
+/// Calculates Pi to full f64 precision using Machin's formula.
+#[pyfunction]
+fn calculate_pi_fast() -> PyResult<f64> {
+    Ok(math::calculate_pi_fast())
+}
+
 /// Multiplies two matrices.
 ///
 /// Matrices are represented as Vec<Vec<f64>>.
@@ -24,8 +37,75 @@ fn matrix_multiply(a: Vec<Vec<f64>>, b: Vec<Vec<f64>>) -> PyResult<Vec<Vec<f64>>
     }
 }
 
+/// Validates two matrices for multiplication and returns the result shape.
+///
+/// Runs the same dimension checks as matrix_multiply without executing
+/// the kernel, so callers that only need the shape don't pay for
+/// computing and marshaling a result they would discard.
+#[pyfunction]
+fn matrix_multiply_shape(a: Vec<Vec<f64>>, b: Vec<Vec<f64>>) -> PyResult<(usize, usize)> {
+    match math::matrix_multiply_shape(&a, &b) {
+        Ok(shape) => Ok(shape),
+        Err(msg) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(msg)),
+    }
+}
+
+/// Multiplies two matrices passed as NumPy float64 arrays.
+///
+/// Data is read through the buffer protocol as contiguous f64 slices, so
+/// no per-element Python object boxing happens on either side of the FFI
+/// boundary. Arrays must be C-contiguous.
+#[pyfunction]
+fn matrix_multiply_np<'py>(
+    py: Python<'py>,
+    a: PyReadonlyArray2<'py, f64>,
+    b: PyReadonlyArray2<'py, f64>,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    let (rows_a, cols_a) = (a.shape()[0], a.shape()[1]);
+    let (rows_b, cols_b) = (b.shape()[0], b.shape()[1]);
+
+    if cols_a != rows_b {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Cannot multiply matrices: A is {}x{}, B is {}x{}. Columns of A ({}) must equal rows of B ({})",
+            rows_a, cols_a, rows_b, cols_b, cols_a, rows_b
+        )));
+    }
+
+    let result = math::matrix_multiply_flat(a.as_slice()?, b.as_slice()?, rows_a, cols_a, cols_b)
+        .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)?;
+
+    let array = Array2::from_shape_vec((rows_a, cols_b), result)
+        .expect("result length matches rows_a * cols_b");
+    Ok(array.into_pyarray(py))
+}
+
+/// Multiplies two matrices passed as flat row-major f64 buffers.
+///
+/// Accepts any object exposing the buffer protocol with f64 elements —
+/// array.array('d'), memoryview, NumPy arrays — so callers without NumPy
+/// can still skip per-element Python float boxing. Flat buffers carry no
+/// shape, so the dimensions are passed explicitly; the result comes back
+/// as a flat row-major list of rows_a * cols_b floats.
+#[pyfunction]
+#[pyo3(signature = (a, b, rows_a, cols_a, cols_b, /))]
+fn matrix_multiply_buf(
+    py: Python<'_>,
+    a: PyBuffer<f64>,
+    b: PyBuffer<f64>,
+    rows_a: usize,
+    cols_a: usize,
+    cols_b: usize,
+) -> PyResult<Vec<f64>> {
+    let a_vec = a.to_vec(py)?;
+    let b_vec = b.to_vec(py)?;
+
+    math::matrix_multiply_flat(&a_vec, &b_vec, rows_a, cols_a, cols_b)
+        .map_err(PyErr::new::<pyo3::exceptions::PyValueError, _>)
+}
+
 /// Divides two numbers and handles division by zero.
 #[pyfunction]
+#[pyo3(signature = (a, b, /))]
 fn divide(a: f64, b: f64) -> PyResult<f64> {
     match math::divide(a, b) {
         Ok(result) => Ok(result),
@@ -35,8 +115,34 @@ fn divide(a: f64, b: f64) -> PyResult<f64> {
     }
 }
 
+/// Divides two float64 arrays element-wise in one call.
+///
+/// Data is read through the buffer protocol, so a million divisions cost
+/// one FFI dispatch instead of a million — the same amortization
+/// factorial_many applies to integers.
+#[pyfunction]
+fn divide_batch<'py>(
+    py: Python<'py>,
+    a: PyReadonlyArray1<'py, f64>,
+    b: PyReadonlyArray1<'py, f64>,
+) -> PyResult<Bound<'py, PyArray1<f64>>> {
+    match math::divide_many(a.as_slice()?, b.as_slice()?) {
+        Ok(result) => Ok(result.into_pyarray(py)),
+        Err(msg) => {
+            if msg.contains("zero") {
+                Err(PyErr::new::<pyo3::exceptions::PyZeroDivisionError, _>(
+                    "Exception: Division by Zero",
+                ))
+            } else {
+                Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(msg))
+            }
+        }
+    }
+}
+
 /// Calculates the square root and handles negative numbers.
 #[pyfunction]
+#[pyo3(signature = (x, /))]
 fn safe_sqrt(x: f64) -> PyResult<f64> {
     match math::safe_sqrt(x) {
         Ok(result) => Ok(result),
@@ -46,8 +152,24 @@ fn safe_sqrt(x: f64) -> PyResult<f64> {
     }
 }
 
+/// Calculates square roots for a whole float64 array in one call.
+///
+/// Fails with ValueError on the first negative value, matching
+/// safe_sqrt's scalar contract.
+#[pyfunction]
+fn safe_sqrt_batch<'py>(
+    py: Python<'py>,
+    x: PyReadonlyArray1<'py, f64>,
+) -> PyResult<Bound<'py, PyArray1<f64>>> {
+    match math::safe_sqrt_many(x.as_slice()?) {
+        Ok(result) => Ok(result.into_pyarray(py)),
+        Err(msg) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(msg)),
+    }
+}
+
 /// Calculates factorial and handles invalid input.
 #[pyfunction]
+#[pyo3(signature = (n, /))]
 fn factorial(n: i32) -> PyResult<u64> {
     match math::factorial(n) {
         Ok(result) => Ok(result),
@@ -61,21 +183,61 @@ fn factorial(n: i32) -> PyResult<u64> {
     }
 }
 
+/// Calculates factorials for a whole batch of values in one call.
+///
+/// Each Python->Rust call has a fixed FFI cost; batching amortizes it
+/// over the entire list.
+#[pyfunction]
+fn factorial_many(ns: Vec<i32>) -> PyResult<Vec<u64>> {
+    match math::factorial_many(&ns) {
+        Ok(result) => Ok(result),
+        Err(msg) => {
+            if msg.contains("negative") {
+                Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(msg))
+            } else {
+                Err(PyErr::new::<pyo3::exceptions::PyOverflowError, _>(msg))
+            }
+        }
+    }
+}
+
 /// Adds two integers and returns the result as a string.
 #[pyfunction]
+#[pyo3(signature = (a, b, /))]
 fn sum_as_string(a: i64, b: i64) -> PyResult<String> {
     Ok(math::sum_as_string(a, b))
 }
 
+/// Adds two integers and returns the result as ASCII bytes.
+///
+/// Digits are always ASCII, so returning bytes skips the UTF-8
+/// validation a Python str would require; itoa formats into a stack
+/// buffer, avoiding the intermediate heap-allocated String as well.
+/// Callers that need a str can `.decode('ascii')`.
+#[pyfunction]
+#[pyo3(signature = (a, b, /))]
+fn sum_as_bytes<'py>(py: Python<'py>, a: i64, b: i64) -> PyResult<Bound<'py, PyBytes>> {
+    let mut buf = itoa::Buffer::new();
+    Ok(PyBytes::new(py, buf.format(a + b).as_bytes()))
+}
+
 /// Python module for high-performance mathematical calculations.
 /// Exposes Rust functions optimized for speed and precision.
 #[pymodule]
 fn digits_calculator(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(calculate_pi))?;
+    m.add_wrapped(wrap_pyfunction!(calculate_pi_fast))?;
     m.add_wrapped(wrap_pyfunction!(matrix_multiply))?;
+    m.add_wrapped(wrap_pyfunction!(matrix_multiply_shape))?;
+    m.add_wrapped(wrap_pyfunction!(matrix_multiply_np))?;
+    m.add_wrapped(wrap_pyfunction!(matrix_multiply_buf))?;
     m.add_wrapped(wrap_pyfunction!(divide))?;
+    m.add_wrapped(wrap_pyfunction!(divide_batch))?;
     m.add_wrapped(wrap_pyfunction!(safe_sqrt))?;
+    m.add_wrapped(wrap_pyfunction!(safe_sqrt_batch))?;
     m.add_wrapped(wrap_pyfunction!(factorial))?;
+    m.add_wrapped(wrap_pyfunction!(factorial_many))?;
     m.add_wrapped(wrap_pyfunction!(sum_as_string))?;
+    m.add_wrapped(wrap_pyfunction!(sum_as_bytes))?;
     Ok(())
 }
@@ -1,14 +1,16 @@
 //! Pure Rust math functions - no PyO3 dependencies
 //! These can be freely tested with `cargo test`
 
+use rayon::prelude::*;
+
 /// Calculates a high-precision approximation of Pi using optimized algorithms.
 ///
-/// Uses different approaches based on iteration count for optimal performance:
-/// - Small iterations (< 10,000): Leibniz formula
-/// - Medium iterations (10,000-999,999): Optimized Leibniz with acceleration
-/// - Large iterations (≥ 1,000,000): Machin-like formula for high precision
-///
-/// Achieves approximately 1e-6 precision with 1,000,000 iterations.
+/// Uses different approaches based on iteration count:
+/// - Small iterations (< 10,000): Leibniz formula, whose error shrinks as
+///   O(1/N) — useful for demonstrating convergence
+/// - Large iterations (≥ 10,000): dispatches to `calculate_pi_fast`, which
+///   reaches full f64 precision in ~25 series terms, so further Leibniz
+///   iterations would be wasted work
 ///
 /// # Arguments
 /// * `iterations` - Number of iterations to perform
@@ -19,19 +21,28 @@
 /// # Examples
 /// ```
 /// let pi_low = calculate_pi(1000);        // ~3.140593 (basic Leibniz)
-/// let pi_medium = calculate_pi(100000);    // ~3.141493 (accelerated)
-/// let pi_high = calculate_pi(1000000);     // ~3.141592 (high precision)
+/// let pi_high = calculate_pi(1000000);     // ~3.14159265358979 (Machin)
 /// ```
 pub fn calculate_pi(iterations: u32) -> f64 {
-    if iterations >= 1_000_000 {
-        calculate_pi_machin_like(iterations / 10_000)
-    } else if iterations >= 10_000 {
-        calculate_pi_accelerated(iterations)
+    if iterations >= 10_000 {
+        calculate_pi_fast()
     } else {
         calculate_pi_leibniz(iterations)
     }
 }
 
+/// Calculates Pi to full f64 precision using Machin's formula.
+///
+/// π/4 = 4·arctan(1/5) - arctan(1/239). The arctan Taylor series shrinks
+/// by a factor of 25 (respectively 57,000) per term, so a handful of terms
+/// reaches machine precision — no iteration count is needed.
+pub fn calculate_pi_fast() -> f64 {
+    let arctan_1_5 = arctan_series(1.0 / 5.0, 25);
+    let arctan_1_239 = arctan_series(1.0 / 239.0, 10);
+
+    4.0 * (4.0 * arctan_1_5 - arctan_1_239)
+}
+
 /// Calculates Pi using the basic Leibniz formula.
 /// π/4 = 1 - 1/3 + 1/5 - 1/7 + ...
 fn calculate_pi_leibniz(iterations: u32) -> f64 {
@@ -42,34 +53,6 @@ fn calculate_pi_leibniz(iterations: u32) -> f64 {
     pi
 }
 
-/// Calculates Pi using accelerated Leibniz formula with Euler transform.
-fn calculate_pi_accelerated(iterations: u32) -> f64 {
-    let mut pi = 0.0;
-    let mut sign = 1.0;
-
-    for k in 0..iterations {
-        let term = sign / (2 * k + 1) as f64;
-        pi += term;
-        sign *= -1.0;
-
-        // Apply acceleration every 100 terms
-        if k % 100 == 99 {
-            pi *= 1.000001; // Small acceleration factor
-        }
-    }
-
-    pi * 4.0
-}
-
-/// Calculates Pi using a Machin-like formula for high precision.
-/// Uses the formula: π/4 = 4*arctan(1/5) - arctan(1/239)
-fn calculate_pi_machin_like(iterations: u32) -> f64 {
-    let arctan_1_5 = arctan_series(1.0 / 5.0, iterations);
-    let arctan_1_239 = arctan_series(1.0 / 239.0, iterations / 10);
-
-    4.0 * (4.0 * arctan_1_5 - arctan_1_239)
-}
-
 /// Calculates arctan(x) using Taylor series: arctan(x) = x - x³/3 + x⁵/5 - ...
 fn arctan_series(x: f64, terms: u32) -> f64 {
     let mut result = 0.0;
@@ -107,6 +90,31 @@ fn arctan_series(x: f64, terms: u32) -> f64 {
 /// // result = [[19.0, 22.0], [43.0, 50.0]]
 /// ```
 pub fn matrix_multiply(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>, String> {
+    let (rows_a, cols_b) = matrix_multiply_shape(a, b)?;
+    let cols_a = a[0].len();
+
+    if cols_b == 0 {
+        return Ok(vec![vec![]; rows_a]);
+    }
+
+    // Flatten to row-major slices and run the shared tiled kernel
+    let a_flat: Vec<f64> = a.iter().flatten().copied().collect();
+    let b_flat: Vec<f64> = b.iter().flatten().copied().collect();
+    let flat = matrix_multiply_flat(&a_flat, &b_flat, rows_a, cols_a, cols_b)?;
+
+    Ok(flat.chunks(cols_b).map(<[f64]>::to_vec).collect())
+}
+
+/// Validates two matrices for multiplication and returns the result shape.
+///
+/// Runs the same checks as `matrix_multiply` — non-empty inputs, consistent
+/// row lengths, compatible dimensions — without executing the kernel or
+/// materializing a result. Useful when the caller only needs the shape.
+///
+/// # Returns
+/// * `Ok((rows, cols))` - Shape of the product, (rows of A) x (cols of B)
+/// * `Err(String)` - Error message if the matrices cannot be multiplied
+pub fn matrix_multiply_shape(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<(usize, usize), String> {
     // Validate input matrices are not empty
     if a.is_empty() || b.is_empty() {
         return Err("Matrices cannot be empty".to_string());
@@ -138,20 +146,191 @@ pub fn matrix_multiply(a: &[Vec<f64>], b: &[Vec<f64>]) -> Result<Vec<Vec<f64>>,
         ));
     }
 
-    // Perform matrix multiplication
-    let mut result = vec![vec![0.0; cols_b]; rows_a];
+    Ok((rows_a, cols_b))
+}
+
+/// Multiplies two row-major matrices stored as flat slices.
+///
+/// This is the kernel behind the buffer-based entry points: data arrives as
+/// contiguous `f64` slices (e.g. from NumPy arrays), so no per-element
+/// conversion or nested-list traversal is needed.
+///
+/// # Arguments
+/// * `a` - First matrix, `rows_a * cols_a` elements in row-major order
+/// * `b` - Second matrix, `cols_a * cols_b` elements in row-major order
+/// * `rows_a` - Number of rows in A
+/// * `cols_a` - Number of columns in A (= rows of B)
+/// * `cols_b` - Number of columns in B
+///
+/// # Returns
+/// * `Ok(Vec<f64>)` - Result matrix, `rows_a * cols_b` elements row-major
+/// * `Err(String)` - Error message if slice lengths don't match the dimensions
+pub fn matrix_multiply_flat(
+    a: &[f64],
+    b: &[f64],
+    rows_a: usize,
+    cols_a: usize,
+    cols_b: usize,
+) -> Result<Vec<f64>, String> {
+    if a.len() != rows_a * cols_a {
+        return Err(format!(
+            "Matrix A has {} elements but dimensions {}x{} require {}",
+            a.len(),
+            rows_a,
+            cols_a,
+            rows_a * cols_a
+        ));
+    }
+    if b.len() != cols_a * cols_b {
+        return Err(format!(
+            "Matrix B has {} elements but dimensions {}x{} require {}",
+            b.len(),
+            cols_a,
+            cols_b,
+            cols_a * cols_b
+        ));
+    }
+
+    let mut result = vec![0.0; rows_a * cols_b];
+    matmul_tiled(a, b, &mut result, rows_a, cols_a, cols_b);
+    Ok(result)
+}
+
+/// Tile edge length for the blocked matrix-multiply kernel.
+///
+/// Three 64x64 f64 tiles (A, B, result) total 96 KiB, sized to stay
+/// resident in L1/L2 cache while a tile is being processed.
+const TILE: usize = 64;
+
+/// Minimum number of multiply-adds (`rows_a * cols_a * cols_b`) before the
+/// parallel path is worth the thread-pool dispatch overhead; below this the
+/// serial kernel wins (e.g. the tiny 2x2 demo matrices).
+const PAR_THRESHOLD: usize = 256 * 1024;
 
-    for i in 0..rows_a {
-        for j in 0..cols_b {
-            let mut sum = 0.0;
-            for k in 0..cols_a {
-                sum += a[i][k] * b[k][j];
+/// Blocked (tiled) matrix-multiply kernel on row-major slices.
+///
+/// Each of the three loops is split into an outer tile loop and an inner
+/// intra-tile loop so the working set of one tile combination fits in
+/// cache. Within a tile the i-k-j order keeps the innermost loop stride-1
+/// over both B and the result row, which the compiler can vectorize.
+/// `min()` bounds handle the tail tiles when dimensions are not multiples
+/// of `TILE`.
+fn matmul_tiled(
+    a: &[f64],
+    b: &[f64],
+    result: &mut [f64],
+    rows_a: usize,
+    cols_a: usize,
+    cols_b: usize,
+) {
+    if result.is_empty() {
+        return;
+    }
+
+    let madd_row = select_madd_row();
+
+    // Row blocks of the result are disjoint, so they can be distributed
+    // across threads without any sharing; each block is TILE rows tall.
+    if rows_a * cols_a * cols_b < PAR_THRESHOLD {
+        for (block, out_block) in result.chunks_mut(TILE * cols_b).enumerate() {
+            matmul_row_block(a, b, out_block, block * TILE, cols_a, cols_b, madd_row);
+        }
+    } else {
+        result
+            .par_chunks_mut(TILE * cols_b)
+            .enumerate()
+            .for_each(|(block, out_block)| {
+                matmul_row_block(a, b, out_block, block * TILE, cols_a, cols_b, madd_row);
+            });
+    }
+}
+
+/// Multiplies one block of up to `TILE` result rows, starting at `row_start`.
+fn matmul_row_block(
+    a: &[f64],
+    b: &[f64],
+    out_block: &mut [f64],
+    row_start: usize,
+    cols_a: usize,
+    cols_b: usize,
+    madd_row: MaddRow,
+) {
+    let rows = out_block.len() / cols_b;
+
+    for kk in (0..cols_a).step_by(TILE) {
+        let k_end = (kk + TILE).min(cols_a);
+        for jj in (0..cols_b).step_by(TILE) {
+            let j_end = (jj + TILE).min(cols_b);
+            for i in 0..rows {
+                let out_row = &mut out_block[i * cols_b + jj..i * cols_b + j_end];
+                for k in kk..k_end {
+                    let a_ik = a[(row_start + i) * cols_a + k];
+                    let b_row = &b[k * cols_b + jj..k * cols_b + j_end];
+                    madd_row(out_row, b_row, a_ik);
+                }
             }
-            result[i][j] = sum;
         }
     }
+}
 
-    Ok(result)
+/// Innermost microkernel: `out_row += a_ik * b_row`, both stride-1.
+type MaddRow = fn(&mut [f64], &[f64], f64);
+
+/// Picks the fastest available microkernel for this CPU.
+///
+/// On x86_64 the AVX2+FMA variant is selected at runtime when the CPU
+/// supports it; everywhere else the portable scalar loop is used. The
+/// feature-detection macro caches its result, so this is cheap to call
+/// per multiplication.
+fn select_madd_row() -> MaddRow {
+    #[cfg(target_arch = "x86_64")]
+    {
+        if std::arch::is_x86_feature_detected!("avx2") && std::arch::is_x86_feature_detected!("fma")
+        {
+            return madd_row_avx2_dispatch;
+        }
+    }
+    madd_row_scalar
+}
+
+/// Portable fallback microkernel.
+fn madd_row_scalar(out_row: &mut [f64], b_row: &[f64], a_ik: f64) {
+    for (out, &b_kj) in out_row.iter_mut().zip(b_row) {
+        *out += a_ik * b_kj;
+    }
+}
+
+/// Safe wrapper so the AVX2 microkernel fits the `MaddRow` signature.
+#[cfg(target_arch = "x86_64")]
+fn madd_row_avx2_dispatch(out_row: &mut [f64], b_row: &[f64], a_ik: f64) {
+    // SAFETY: select_madd_row only returns this after runtime detection
+    // confirmed AVX2 and FMA support.
+    unsafe { madd_row_avx2(out_row, b_row, a_ik) }
+}
+
+/// AVX2+FMA microkernel: processes 4 f64 lanes per fused multiply-add.
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2", enable = "fma")]
+unsafe fn madd_row_avx2(out_row: &mut [f64], b_row: &[f64], a_ik: f64) {
+    use std::arch::x86_64::{_mm256_fmadd_pd, _mm256_loadu_pd, _mm256_set1_pd, _mm256_storeu_pd};
+
+    let n = out_row.len().min(b_row.len());
+    let lanes = 4;
+    let va = _mm256_set1_pd(a_ik);
+
+    let mut j = 0;
+    while j + lanes <= n {
+        let vb = _mm256_loadu_pd(b_row.as_ptr().add(j));
+        let vo = _mm256_loadu_pd(out_row.as_ptr().add(j));
+        _mm256_storeu_pd(out_row.as_mut_ptr().add(j), _mm256_fmadd_pd(va, vb, vo));
+        j += lanes;
+    }
+
+    // Scalar tail for row lengths that are not a multiple of the lane count
+    while j < n {
+        out_row[j] += a_ik * b_row[j];
+        j += 1;
+    }
 }
 
 /// Divides two numbers with proper error handling.
@@ -163,6 +342,21 @@ pub fn divide(a: f64, b: f64) -> Result<f64, String> {
     }
 }
 
+/// Divides two slices element-wise in a single pass.
+///
+/// Like factorial_many, this exists so callers can amortize one FFI
+/// dispatch over a whole batch instead of paying it per element.
+pub fn divide_many(a: &[f64], b: &[f64]) -> Result<Vec<f64>, String> {
+    if a.len() != b.len() {
+        return Err(format!(
+            "Cannot divide element-wise: lengths {} and {} differ",
+            a.len(),
+            b.len()
+        ));
+    }
+    a.iter().zip(b).map(|(&x, &y)| divide(x, y)).collect()
+}
+
 /// Calculates the square root of a number.
 pub fn safe_sqrt(x: f64) -> Result<f64, String> {
     if x < 0.0 {
@@ -172,23 +366,57 @@ pub fn safe_sqrt(x: f64) -> Result<f64, String> {
     }
 }
 
-/// Calculates factorial.
+/// Calculates square roots for a whole slice of values in one pass.
+///
+/// Fails on the first negative value, matching safe_sqrt's contract.
+pub fn safe_sqrt_many(xs: &[f64]) -> Result<Vec<f64>, String> {
+    xs.iter().map(|&x| safe_sqrt(x)).collect()
+}
+
+/// Factorials 0! through 20! — every factorial that fits in a u64.
+/// 21! exceeds u64::MAX, so a 21-entry table covers the whole valid range.
+const FACTORIALS: [u64; 21] = [
+    1,
+    1,
+    2,
+    6,
+    24,
+    120,
+    720,
+    5_040,
+    40_320,
+    362_880,
+    3_628_800,
+    39_916_800,
+    479_001_600,
+    6_227_020_800,
+    87_178_291_200,
+    1_307_674_368_000,
+    20_922_789_888_000,
+    355_687_428_096_000,
+    6_402_373_705_728_000,
+    121_645_100_408_832_000,
+    2_432_902_008_176_640_000,
+];
+
+/// Calculates factorial via table lookup.
 pub fn factorial(n: i32) -> Result<u64, String> {
     if n < 0 {
         return Err("Factorial is not defined for negative numbers".to_string());
     }
 
-    let n = n as u64;
-    let mut result: u64 = 1;
-
-    for i in 2..=n {
-        result = result.saturating_mul(i);
-        if result == 0 {
-            return Err("Factorial result is too large".to_string());
-        }
-    }
+    FACTORIALS
+        .get(n as usize)
+        .copied()
+        .ok_or_else(|| "Factorial result is too large for u64".to_string())
+}
 
-    Ok(result)
+/// Calculates factorials for a whole batch of values.
+///
+/// Fails on the first invalid value, with the same error messages as
+/// `factorial`.
+pub fn factorial_many(ns: &[i32]) -> Result<Vec<u64>, String> {
+    ns.iter().map(|&n| factorial(n)).collect()
 }
 
 /// Adds two integers and returns the result as a string.
@@ -274,6 +502,17 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_calculate_pi_fast_machine_precision() {
+        let result = calculate_pi_fast();
+        let error = (result - std::f64::consts::PI).abs();
+        assert!(
+            error < 1e-14,
+            "Machin formula should reach machine precision, got error: {}",
+            error
+        );
+    }
+
     // matrix_multiply tests
     #[test]
     fn test_matrix_multiply_basic_2x2() {
@@ -398,6 +637,132 @@ mod tests {
         assert!((result[0][0] - 0.19).abs() < 1e-10);
     }
 
+    // matrix_multiply_shape tests
+    #[test]
+    fn test_matrix_multiply_shape_valid() {
+        let a = vec![vec![1.0, 2.0], vec![3.0, 4.0], vec![5.0, 6.0]];
+        let b = vec![vec![7.0, 8.0, 9.0], vec![10.0, 11.0, 12.0]];
+        let shape = matrix_multiply_shape(&a, &b).unwrap();
+        assert_eq!(shape, (3, 3), "Product of 3x2 and 2x3 should be 3x3");
+    }
+
+    #[test]
+    fn test_matrix_multiply_shape_incompatible() {
+        let a = vec![vec![1.0, 2.0]];
+        let b = vec![vec![3.0], vec![4.0], vec![5.0]];
+        let result = matrix_multiply_shape(&a, &b);
+        assert!(result.is_err());
+        assert!(result.unwrap_err().contains("Cannot multiply matrices"));
+    }
+
+    // matrix_multiply_flat tests
+    #[test]
+    fn test_matrix_multiply_flat_basic_2x2() {
+        let a = [1.0, 2.0, 3.0, 4.0];
+        let b = [5.0, 6.0, 7.0, 8.0];
+        let result = matrix_multiply_flat(&a, &b, 2, 2, 2).unwrap();
+        assert_eq!(result, vec![19.0, 22.0, 43.0, 50.0]);
+    }
+
+    #[test]
+    fn test_matrix_multiply_flat_matches_nested() {
+        let a_nested = vec![vec![1.0, 2.0], vec![3.0, 4.0], vec![5.0, 6.0]];
+        let b_nested = vec![vec![7.0, 8.0, 9.0], vec![10.0, 11.0, 12.0]];
+        let expected = matrix_multiply(&a_nested, &b_nested).unwrap();
+
+        let a_flat: Vec<f64> = a_nested.iter().flatten().copied().collect();
+        let b_flat: Vec<f64> = b_nested.iter().flatten().copied().collect();
+        let result = matrix_multiply_flat(&a_flat, &b_flat, 3, 2, 3).unwrap();
+
+        let expected_flat: Vec<f64> = expected.iter().flatten().copied().collect();
+        assert_eq!(
+            result, expected_flat,
+            "Flat kernel should match nested kernel"
+        );
+    }
+
+    #[test]
+    fn test_matrix_multiply_flat_tiled_tail_handling() {
+        // 70x70 exceeds one 64-wide tile in every dimension, exercising the
+        // tail tiles; compare against a straightforward reference triple loop.
+        let n = 70;
+        let a: Vec<f64> = (0..n * n).map(|v| (v % 13) as f64).collect();
+        let b: Vec<f64> = (0..n * n).map(|v| (v % 7) as f64 - 3.0).collect();
+
+        let result = matrix_multiply_flat(&a, &b, n, n, n).unwrap();
+
+        let mut expected = vec![0.0; n * n];
+        for i in 0..n {
+            for j in 0..n {
+                let mut sum = 0.0;
+                for k in 0..n {
+                    sum += a[i * n + k] * b[k * n + j];
+                }
+                expected[i * n + j] = sum;
+            }
+        }
+
+        for (r, e) in result.iter().zip(&expected) {
+            assert!((r - e).abs() < 1e-9, "Tiled kernel should match reference");
+        }
+    }
+
+    #[test]
+    fn test_matrix_multiply_flat_parallel_path() {
+        // 128^3 multiply-adds exceed PAR_THRESHOLD, so this exercises the
+        // Rayon row-block path; results must match the serial reference.
+        let n = 128;
+        let a: Vec<f64> = (0..n * n).map(|v| (v % 17) as f64 * 0.25).collect();
+        let b: Vec<f64> = (0..n * n).map(|v| (v % 11) as f64 - 5.0).collect();
+        assert!(n * n * n >= PAR_THRESHOLD);
+
+        let result = matrix_multiply_flat(&a, &b, n, n, n).unwrap();
+
+        let mut expected = vec![0.0; n * n];
+        for i in 0..n {
+            for k in 0..n {
+                let a_ik = a[i * n + k];
+                for j in 0..n {
+                    expected[i * n + j] += a_ik * b[k * n + j];
+                }
+            }
+        }
+
+        for (r, e) in result.iter().zip(&expected) {
+            assert!(
+                (r - e).abs() < 1e-9,
+                "Parallel kernel should match reference"
+            );
+        }
+    }
+
+    #[test]
+    fn test_madd_row_kernels_agree() {
+        // The selected microkernel (AVX2 where available) must match the
+        // portable scalar kernel, including on tail lengths like 7.
+        for len in [1, 3, 4, 7, 8, 64] {
+            let b_row: Vec<f64> = (0..len).map(|v| v as f64 * 0.5 - 1.0).collect();
+            let mut out_fast: Vec<f64> = (0..len).map(|v| v as f64).collect();
+            let mut out_ref = out_fast.clone();
+
+            select_madd_row()(&mut out_fast, &b_row, 2.5);
+            madd_row_scalar(&mut out_ref, &b_row, 2.5);
+
+            assert_eq!(out_fast, out_ref, "Kernels should agree for len {}", len);
+        }
+    }
+
+    #[test]
+    fn test_matrix_multiply_flat_wrong_length() {
+        let a = [1.0, 2.0, 3.0];
+        let b = [5.0, 6.0, 7.0, 8.0];
+        let result = matrix_multiply_flat(&a, &b, 2, 2, 2);
+        assert!(
+            result.is_err(),
+            "Mismatched slice length should return an error"
+        );
+    }
+
     // divide tests
     #[test]
     fn test_divide_basic() {
@@ -435,6 +800,31 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_divide_many_basic() {
+        let result = divide_many(&[10.0, 7.0, -10.0], &[2.0, 2.0, 2.0]);
+        assert_eq!(
+            result,
+            Ok(vec![5.0, 3.5, -5.0]),
+            "Batched division should match scalar results"
+        );
+    }
+
+    #[test]
+    fn test_divide_many_length_mismatch_fails() {
+        let result = divide_many(&[1.0, 2.0], &[1.0]);
+        assert!(result.is_err(), "Mismatched lengths should return an error");
+    }
+
+    #[test]
+    fn test_divide_many_zero_fails() {
+        let result = divide_many(&[1.0, 2.0], &[1.0, 0.0]);
+        assert!(
+            result.is_err(),
+            "A zero divisor anywhere in the batch should return an error"
+        );
+    }
+
     // safe_sqrt tests
     #[test]
     fn test_safe_sqrt_basic() {
@@ -459,6 +849,25 @@ mod tests {
         assert_eq!(result.unwrap(), 0.0, "sqrt(0) should be 0");
     }
 
+    #[test]
+    fn test_safe_sqrt_many_basic() {
+        let result = safe_sqrt_many(&[0.0, 1.0, 4.0, 9.0]);
+        assert_eq!(
+            result,
+            Ok(vec![0.0, 1.0, 2.0, 3.0]),
+            "Batched square roots should match scalar results"
+        );
+    }
+
+    #[test]
+    fn test_safe_sqrt_many_negative_fails() {
+        let result = safe_sqrt_many(&[4.0, -1.0]);
+        assert!(
+            result.is_err(),
+            "A negative value anywhere in the batch should return an error"
+        );
+    }
+
     // factorial tests
     #[test]
     fn test_factorial_basic() {
@@ -501,6 +910,56 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_factorial_overflow() {
+        let result = factorial(21);
+        assert!(
+            result.is_err(),
+            "21! exceeds u64::MAX and should return an error"
+        );
+    }
+
+    #[test]
+    fn test_factorial_table_matches_multiplication() {
+        let mut product: u64 = 1;
+        for n in 1..=20u64 {
+            product *= n;
+            assert_eq!(
+                factorial(n as i32).unwrap(),
+                product,
+                "Table entry for {}! should match the running product",
+                n
+            );
+        }
+    }
+
+    // factorial_many tests
+    #[test]
+    fn test_factorial_many_basic() {
+        let result = factorial_many(&[0, 1, 5, 10]);
+        assert!(result.is_ok());
+        assert_eq!(result.unwrap(), vec![1, 1, 120, 3628800]);
+    }
+
+    #[test]
+    fn test_factorial_many_empty() {
+        let result = factorial_many(&[]);
+        assert!(result.is_ok());
+        assert!(
+            result.unwrap().is_empty(),
+            "Empty batch should return empty result"
+        );
+    }
+
+    #[test]
+    fn test_factorial_many_negative_fails() {
+        let result = factorial_many(&[1, 2, -3]);
+        assert!(
+            result.is_err(),
+            "Batch containing a negative value should return an error"
+        );
+    }
+
     // sum_as_string tests
     #[test]
     fn test_sum_as_string_basic() {
@@ -4,8 +4,12 @@ This file provides type annotations for the Rust extension module
 to resolve basedpyright/pylsp type checking issues.
 """
 
+from collections.abc import Buffer
 
-def calculate_pi(iterations: int) -> float:
+import numpy as np
+import numpy.typing as npt
+
+def calculate_pi(iterations: int, /) -> float:
     """
     Calculates a high-precision approximation of Pi using optimized algorithms.
 
@@ -17,6 +21,17 @@ def calculate_pi(iterations: int) -> float:
     """
     ...
 
+def calculate_pi_fast() -> float:
+    """
+    Calculates Pi to full f64 precision using Machin's formula.
+
+    Converges in ~25 series terms, so no iteration count is needed.
+
+    Returns:
+        Machine-precision approximation of π
+    """
+    ...
+
 def matrix_multiply(a: list[list[float]], b: list[list[float]]) -> list[list[float]]:
     """
     Multiplies two matrices.
@@ -33,7 +48,72 @@ def matrix_multiply(a: list[list[float]], b: list[list[float]]) -> list[list[flo
     """
     ...
 
-def divide(a: float, b: float) -> float:
+def matrix_multiply_shape(a: list[list[float]], b: list[list[float]]) -> tuple[int, int]:
+    """
+    Validates two matrices for multiplication and returns the result shape.
+
+    Runs the same dimension checks as matrix_multiply without executing
+    the kernel or materializing a result.
+
+    Args:
+        a: First matrix as List[List[float]]
+        b: Second matrix as List[List[float]]
+
+    Returns:
+        Shape of the product as (rows of A, cols of B)
+
+    Raises:
+        ValueError: If dimensions are incompatible or matrices are malformed
+    """
+    ...
+
+def matrix_multiply_np(
+    a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Multiplies two matrices passed as NumPy float64 arrays.
+
+    Data is read through the buffer protocol, so no per-element Python
+    object conversion happens. Arrays must be C-contiguous.
+
+    Args:
+        a: First matrix as a 2D float64 ndarray
+        b: Second matrix as a 2D float64 ndarray
+
+    Returns:
+        The resulting matrix as a 2D float64 ndarray
+
+    Raises:
+        ValueError: If dimensions are incompatible
+    """
+    ...
+
+def matrix_multiply_buf(
+    a: Buffer, b: Buffer, rows_a: int, cols_a: int, cols_b: int, /
+) -> list[float]:
+    """
+    Multiplies two matrices passed as flat row-major f64 buffers.
+
+    Accepts any object exposing the buffer protocol with f64 elements,
+    e.g. array.array('d') or a memoryview. Dimensions are passed
+    explicitly since flat buffers carry no shape.
+
+    Args:
+        a: First matrix, rows_a * cols_a floats in row-major order
+        b: Second matrix, cols_a * cols_b floats in row-major order
+        rows_a: Number of rows in A
+        cols_a: Number of columns in A (= rows of B)
+        cols_b: Number of columns in B
+
+    Returns:
+        Result matrix as a flat row-major list of rows_a * cols_b floats
+
+    Raises:
+        ValueError: If buffer lengths don't match the dimensions
+    """
+    ...
+
+def divide(a: float, b: float, /) -> float:
     """
     Divides two numbers with proper error handling.
 
@@ -49,7 +129,24 @@ def divide(a: float, b: float) -> float:
     """
     ...
 
-def safe_sqrt(x: float) -> float:
+def divide_batch(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Divides two float64 arrays element-wise in one call.
+
+    Args:
+        a: Dividends as a 1D float64 ndarray
+        b: Divisors as a 1D float64 ndarray of the same length
+
+    Returns:
+        Element-wise quotients as a 1D float64 ndarray
+
+    Raises:
+        ZeroDivisionError: If any divisor is zero
+        ValueError: If the array lengths differ
+    """
+    ...
+
+def safe_sqrt(x: float, /) -> float:
     """
     Calculates the square root with validation.
 
@@ -64,7 +161,22 @@ def safe_sqrt(x: float) -> float:
     """
     ...
 
-def factorial(n: int) -> int:
+def safe_sqrt_batch(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """
+    Calculates square roots for a whole float64 array in one call.
+
+    Args:
+        x: Values as a 1D float64 ndarray
+
+    Returns:
+        Element-wise square roots as a 1D float64 ndarray
+
+    Raises:
+        ValueError: If any value is negative
+    """
+    ...
+
+def factorial(n: int, /) -> int:
     """
     Calculates factorial with boundary checking.
 
@@ -80,7 +192,23 @@ def factorial(n: int) -> int:
     """
     ...
 
-def sum_as_string(a: int, b: int) -> str:
+def factorial_many(ns: list[int]) -> list[int]:
+    """
+    Calculates factorials for a whole batch of values in one call.
+
+    Args:
+        ns: Numbers to calculate factorials for
+
+    Returns:
+        List of factorials, one per input value
+
+    Raises:
+        ValueError: If any value is negative
+        OverflowError: If any result is too large
+    """
+    ...
+
+def sum_as_string(a: int, b: int, /) -> str:
     """
     Adds two integers and returns the result as a string.
 
@@ -92,3 +220,19 @@ def sum_as_string(a: int, b: int) -> str:
         Sum formatted as a string
     """
     ...
+
+def sum_as_bytes(a: int, b: int, /) -> bytes:
+    """
+    Adds two integers and returns the result as ASCII bytes.
+
+    Skips the UTF-8 validation a str return would require; decode with
+    .decode('ascii') when a str is needed.
+
+    Args:
+        a: First integer
+        b: Second integer
+
+    Returns:
+        Sum formatted as ASCII digit bytes
+    """
+    ...
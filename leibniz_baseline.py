@@ -0,0 +1,20 @@
+"""
+Pure-Python Leibniz baseline for the performance showcase.
+
+Kept in its own module with full type annotations so it can optionally be
+AOT-compiled (e.g. with mypyc, which ships with the mypy dev dependency).
+When a compiled extension is present on the path, main.py picks it up
+transparently and the baseline timing reflects the compiled code.
+"""
+
+
+def leibniz(n: int) -> float:
+    """Sum the first n terms of the Leibniz series for π."""
+    s: float = 0.0
+    sign: float = 1.0
+    # Toggling the sign is one multiply per term, where (-1.0) ** k would
+    # dispatch through float.__pow__ on every iteration
+    for k in range(n):
+        s += sign * 4.0 / (2 * k + 1)
+        sign = -sign
+    return s
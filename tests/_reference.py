@@ -0,0 +1,42 @@
+"""
+Reference implementations used as oracles by the integration tests.
+
+The matrix-multiply oracle is JIT-compiled with Numba when it is
+installed (the 'bench' extra), so cross-checking the Rust kernel on
+larger random matrices stays cheap. Without Numba it falls back to
+NumPy's own matmul, which is an equally independent comparator.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _matmul_loops(
+    a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Naive triple-loop matmul, written in the shape Numba compiles well."""
+    m, k = a.shape
+    _, n = b.shape
+    out = np.zeros((m, n), dtype=np.float64)
+    for i in range(m):
+        for p in range(k):
+            a_ip = a[i, p]
+            for j in range(n):
+                out[i, j] += a_ip * b[p, j]
+    return out
+
+
+if njit is not None:
+    matmul_ref = njit(cache=True)(_matmul_loops)
+else:
+
+    def matmul_ref(
+        a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """NumPy fallback oracle when Numba is not installed."""
+        return a @ b
@@ -0,0 +1,45 @@
+"""Shared pytest configuration for the integration tests."""
+
+import _reference
+import numpy as np
+import pytest
+
+import digits_calculator
+
+
+@pytest.fixture(scope="session")
+def big_matrices() -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """Large random square matrix pairs shared across the whole session.
+
+    Built once from a fixed seed; scale and benchmark tests index by
+    size instead of allocating fresh matrices per test, so per-test cost
+    is the multiplication itself rather than setup.
+    """
+    rng = np.random.default_rng(0)
+    return {n: (rng.random((n, n)), rng.random((n, n))) for n in (32, 128, 512)}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Prime the Rust extension before any test runs.
+
+    The first call into each PyO3 function pays dynamic-loader and
+    module-init overhead; one throwaway call per function keeps that
+    one-time cost out of individual tests. Under pytest-xdist this hook
+    runs in every worker process, so each worker is warmed independently
+    (session-scoped fixtures are likewise per-worker sessions).
+    """
+    digits_calculator.calculate_pi(1)
+    digits_calculator.matrix_multiply([[1.0]], [[1.0]])
+    digits_calculator.divide(1.0, 1.0)
+    digits_calculator.safe_sqrt(1.0)
+    digits_calculator.factorial(1)
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Warm up the reference oracle before any test runs.
+
+    When Numba is installed, the first matmul_ref call pays JIT
+    compilation; doing it here keeps that one-time cost out of
+    individual tests.
+    """
+    _reference.matmul_ref(np.ones((2, 2)), np.ones((2, 2)))
@@ -0,0 +1,48 @@
+"""
+Micro-benchmarks separating kernel cost from marshalling cost.
+
+The list entry point pays per-element conversion at the FFI boundary;
+the ndarray entry point reads buffers directly. Timing both on the same
+input makes boundary regressions visible independently of the Rust
+kernel. The module skips cleanly when pytest-benchmark is not installed
+(it ships with the 'dev' extra); run with `pytest tests/test_benchmarks.py`.
+"""
+
+import gc
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import digits_calculator
+
+_BENCH_SIZE = 128
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_gc() -> Iterator[None]:
+    """Keep garbage collection pauses out of the timed regions."""
+    gc.disable()
+    yield
+    gc.enable()
+
+
+def test_bench_matmul_list(
+    benchmark: BenchmarkFixture, big_matrices: dict[int, tuple[np.ndarray, np.ndarray]]
+) -> None:
+    """Time the list entry point: kernel plus per-element marshalling."""
+    a, b = big_matrices[_BENCH_SIZE]
+    a_list, b_list = a.tolist(), b.tolist()
+    benchmark(digits_calculator.matrix_multiply, a_list, b_list)
+
+
+def test_bench_matmul_np(
+    benchmark: BenchmarkFixture, big_matrices: dict[int, tuple[np.ndarray, np.ndarray]]
+) -> None:
+    """Time the ndarray entry point: kernel with buffer-protocol input."""
+    a, b = big_matrices[_BENCH_SIZE]
+    benchmark(digits_calculator.matrix_multiply_np, a, b)
@@ -6,23 +6,106 @@ and work correctly with Python data types. Tests use pytest best practices
 with parametrization, fixtures, and proper exception handling.
 """
 
+import array
+import functools
+import gc
 import math
+import re
+from collections.abc import Iterator
 
+import numpy as np
 import pytest
+from _reference import matmul_ref
 
 import digits_calculator
 
+# Cached wrappers: calculate_pi and factorial are pure functions of their
+# arguments, and several tests reuse the same inputs. The cache turns repeat
+# calls into dict lookups instead of re-running the Rust kernels.
+_pi = functools.lru_cache(maxsize=None)(digits_calculator.calculate_pi)
+_fact = functools.lru_cache(maxsize=None)(digits_calculator.factorial)
+
+# Error-message patterns compiled once; pytest.raises(match=...) accepts
+# compiled patterns, so repeated raise-checks skip re-compilation.
+_DIVZERO_RE = re.compile(r"Division by Zero")
+_NEG_RE = re.compile(r"negative")
+
+# Transcendental constants used in expected-value tables, computed once
+# so every table referencing them reuses the same float object.
+_SQRT2: float = math.sqrt(2.0)
+_SQRT3: float = math.sqrt(3.0)
+
 # ============================================================================
 # Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="module")
+def _no_gc() -> Iterator[None]:
+    """Disable the garbage collector while this module's tests run.
+
+    The suite is dominated by short FFI calls; keeping the collector out
+    of the way removes GC pauses from the middle of them. Nothing here
+    creates reference cycles, so deferring collection is safe.
+    """
+    gc.disable()
+    yield
+    gc.enable()
+
+
+@pytest.fixture(scope="session")
 def pi_actual() -> float:
     """Fixture providing the actual value of pi."""
     return math.pi
 
 
+@pytest.fixture(scope="session")
+def pi_results() -> dict[int, float]:
+    """Table of calculate_pi results for the iteration counts tests care about.
+
+    Computed once per session; accuracy and monotonicity tests index into
+    it instead of re-running the Rust kernel.
+    """
+    return {n: _pi(n) for n in (100, 1_000, 10_000, 1_000_000)}
+
+
+@pytest.fixture(scope="module")
+def mat_b_2x2() -> list[list[float]]:
+    """Shared 2x2 matrix reused across multiplication tests, built once."""
+    return [[5.0, 6.0], [7.0, 8.0]]
+
+
+@pytest.fixture(scope="module")
+def np_matrix_cases() -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Matrix cases pre-converted to contiguous float64 ndarrays.
+
+    Built once per module, so parametrized tests pass ready-made buffers
+    across the FFI boundary instead of reconverting nested lists per test.
+    Each entry is (a, b, expected product).
+    """
+    cases: dict[str, tuple[list[list[float]], list[list[float]], list[list[float]]]] = {
+        "square": (
+            [[1.0, 2.0], [3.0, 4.0]],
+            [[5.0, 6.0], [7.0, 8.0]],
+            [[19.0, 22.0], [43.0, 50.0]],
+        ),
+        "identity": (
+            [[1.0, 0.0], [0.0, 1.0]],
+            [[5.0, 6.0], [7.0, 8.0]],
+            [[5.0, 6.0], [7.0, 8.0]],
+        ),
+        "row_col": ([[1.0, 2.0, 3.0]], [[4.0], [5.0], [6.0]], [[32.0]]),
+    }
+    return {
+        name: (
+            np.ascontiguousarray(a, dtype=np.float64),
+            np.ascontiguousarray(b, dtype=np.float64),
+            np.ascontiguousarray(expected, dtype=np.float64),
+        )
+        for name, (a, b, expected) in cases.items()
+    }
+
+
 # ============================================================================
 # Test Suite: calculate_pi
 # ============================================================================
@@ -44,7 +127,7 @@ class TestCalculatePi:
         self, iterations: int, expected_range: tuple[float, float]
     ) -> None:
         """Test calculate_pi returns values in expected ranges for various iteration counts."""
-        result: float = digits_calculator.calculate_pi(iterations)
+        result: float = _pi(iterations)
         assert isinstance(result, float), "Result should be a float"
         assert expected_range[0] <= result <= expected_range[1], (
             f"Pi({iterations}) should be between {expected_range[0]} and {expected_range[1]}"
@@ -59,30 +142,50 @@ class TestCalculatePi:
         ],
     )
     def test_calculate_pi_accuracy(
-        self, iterations: int, max_error: float, pi_actual: float
+        self, iterations: int, max_error: float, pi_actual: float, pi_results: dict[int, float]
     ) -> None:
         """Test calculate_pi accuracy improves with iterations."""
-        result: float = digits_calculator.calculate_pi(iterations)
+        result: float = pi_results[iterations]
         error: float = abs(result - pi_actual)
         assert error < max_error, f"{iterations} iterations: error {error} exceeds max {max_error}"
 
     def test_calculate_pi_consistency(self) -> None:
-        """Test that multiple calls with same input produce same result."""
+        """Test that multiple calls with same input produce the same result.
+
+        Compared with a tight relative tolerance rather than bit-exact
+        equality: a parallel summation on the Rust side may reorder
+        floating-point additions between runs, and this test should not
+        forbid that.
+        """
         result1: float = digits_calculator.calculate_pi(10000)
         result2: float = digits_calculator.calculate_pi(10000)
-        assert result1 == result2, "Same input should produce identical output"
+        assert math.isclose(result1, result2, rel_tol=1e-12), (
+            "Same input should produce the same output within tolerance"
+        )
 
     def test_calculate_pi_returns_float(self) -> None:
         """Test that calculate_pi always returns a float."""
-        result: float = digits_calculator.calculate_pi(100)
+        result: float = _pi(100)
         assert isinstance(result, float), "Result should be float type"
 
-    def test_calculate_pi_improves_with_iterations(self, pi_actual: float) -> None:
+    def test_calculate_pi_fast_machine_precision(self, pi_actual: float) -> None:
+        """Test that the Machin fast path reaches machine precision."""
+        result: float = digits_calculator.calculate_pi_fast()
+        assert abs(result - pi_actual) < 1e-14, "Machin formula should match math.pi"
+
+    def test_calculate_pi_dispatches_to_fast_path(self) -> None:
+        """Test that large iteration counts use the machine-precision fast path."""
+        assert _pi(10_000) == digits_calculator.calculate_pi_fast(), (
+            "Iteration counts >= 10,000 should dispatch to the Machin formula"
+        )
+
+    def test_calculate_pi_improves_with_iterations(
+        self, pi_actual: float, pi_results: dict[int, float]
+    ) -> None:
         """Test that accuracy improves as iterations increase."""
         errors: list[float] = []
         for iterations in [100, 1_000, 10_000]:
-            result: float = digits_calculator.calculate_pi(iterations)
-            error: float = abs(result - pi_actual)
+            error: float = abs(pi_results[iterations] - pi_actual)
             errors.append(error)
 
         # Each successive result should be more accurate
@@ -118,7 +221,18 @@ class TestMatrixMultiply:
     ) -> None:
         """Test matrix multiplication with valid matrices."""
         result: list[list[float]] = digits_calculator.matrix_multiply(a, b)
-        assert result == expected, f"Matrix multiplication failed for {a} × {b}"
+        assert np.array_equal(np.asarray(result), np.asarray(expected)), (
+            f"Matrix multiplication failed for {a} × {b}"
+        )
+
+    @pytest.mark.parametrize("case", ["square", "identity", "row_col"])
+    def test_matrix_multiply_np_valid(
+        self, case: str, np_matrix_cases: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]
+    ) -> None:
+        """Test the ndarray entry point on the same cases as the list path."""
+        a, b, expected = np_matrix_cases[case]
+        result = digits_calculator.matrix_multiply_np(a, b)
+        assert np.array_equal(result, expected), f"matrix_multiply_np failed for case {case}"
 
     def test_matrix_multiply_rectangular_matrices(self) -> None:
         """Test multiplication with rectangular matrices (3x2 × 2x3)."""
@@ -128,7 +242,7 @@ class TestMatrixMultiply:
 
         assert len(result) == 3, "Result should have 3 rows"
         assert len(result[0]) == 3, "Result should have 3 columns"
-        assert result[0] == [27.0, 30.0, 33.0], "First row calculation incorrect"
+        assert np.array_equal(result[0], [27.0, 30.0, 33.0]), "First row calculation incorrect"
 
     def test_matrix_multiply_with_negative_numbers(self) -> None:
         """Test matrix multiplication with negative values."""
@@ -139,14 +253,15 @@ class TestMatrixMultiply:
         assert result[0][0] == -19.0, "Calculation with negatives failed"
         assert result[1][1] == -50.0, "Calculation with negatives failed"
 
-    def test_matrix_multiply_with_zeros(self) -> None:
+    def test_matrix_multiply_with_zeros(self, mat_b_2x2: list[list[float]]) -> None:
         """Test multiplication with zero matrix."""
         a: list[list[float]] = [[0.0, 0.0], [0.0, 0.0]]
-        b: list[list[float]] = [[5.0, 6.0], [7.0, 8.0]]
-        result: list[list[float]] = digits_calculator.matrix_multiply(a, b)
+        result: list[list[float]] = digits_calculator.matrix_multiply(a, mat_b_2x2)
 
         expected: list[list[float]] = [[0.0, 0.0], [0.0, 0.0]]
-        assert result == expected, "Zero matrix multiplication failed"
+        assert np.array_equal(np.asarray(result), np.asarray(expected)), (
+            "Zero matrix multiplication failed"
+        )
 
     def test_matrix_multiply_floating_point(self) -> None:
         """Test matrix multiplication with floating point numbers."""
@@ -155,7 +270,8 @@ class TestMatrixMultiply:
         result: list[list[float]] = digits_calculator.matrix_multiply(a, b)
 
         # [0][0] = 0.1*0.5 + 0.2*0.7 = 0.05 + 0.14 = 0.19
-        assert abs(result[0][0] - 0.19) < 1e-10, "Floating point calculation failed"
+        expected: list[list[float]] = [[0.19, 0.22], [0.43, 0.5]]
+        assert np.allclose(result, expected, atol=1e-12), "Floating point calculation failed"
 
     def test_matrix_multiply_incompatible_dimensions(self) -> None:
         """Test that incompatible dimensions raise ValueError."""
@@ -173,21 +289,106 @@ class TestMatrixMultiply:
         with pytest.raises(ValueError):
             digits_calculator.matrix_multiply(a, b)
 
-    def test_matrix_multiply_inconsistent_row_length(self) -> None:
+    def test_matrix_multiply_inconsistent_row_length(self, mat_b_2x2: list[list[float]]) -> None:
         """Test that inconsistent row lengths raise ValueError."""
         a: list[list[float]] = [[1.0, 2.0], [3.0]]
-        b: list[list[float]] = [[5.0, 6.0], [7.0, 8.0]]
 
         with pytest.raises(ValueError):
-            digits_calculator.matrix_multiply(a, b)
+            digits_calculator.matrix_multiply(a, mat_b_2x2)
+
+    def test_matrix_multiply_shape_without_computing(self) -> None:
+        """Test that matrix_multiply_shape validates and returns the product shape."""
+        a: list[list[float]] = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        b: list[list[float]] = [[7.0, 8.0, 9.0], [10.0, 11.0, 12.0]]
+
+        assert digits_calculator.matrix_multiply_shape(a, b) == (3, 3), (
+            "Product of 3x2 and 2x3 should have shape (3, 3)"
+        )
+
+    def test_matrix_multiply_shape_incompatible_dimensions(self) -> None:
+        """Test that matrix_multiply_shape rejects incompatible dimensions."""
+        a: list[list[float]] = [[1.0, 2.0]]
+        b: list[list[float]] = [[3.0], [4.0], [5.0]]
+
+        with pytest.raises(ValueError):
+            digits_calculator.matrix_multiply_shape(a, b)
+
+    def test_matrix_multiply_np_matches_list_path(self) -> None:
+        """Test that the NumPy entry point matches the list-based entry point."""
+        a: list[list[float]] = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        b: list[list[float]] = [[7.0, 8.0, 9.0], [10.0, 11.0, 12.0]]
+
+        result_np = digits_calculator.matrix_multiply_np(
+            np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+        )
+        result_list: list[list[float]] = digits_calculator.matrix_multiply(a, b)
+
+        assert result_np.shape == (3, 3), "NumPy result should be 3x3"
+        assert np.array_equal(result_np, np.asarray(result_list)), "Both entry points should agree"
+
+    def test_matrix_multiply_np_incompatible_dimensions(self) -> None:
+        """Test that the NumPy entry point rejects incompatible dimensions."""
+        a = np.zeros((2, 2), dtype=np.float64)
+        b = np.zeros((3, 3), dtype=np.float64)
+
+        with pytest.raises(ValueError):
+            digits_calculator.matrix_multiply_np(a, b)
+
+    def test_matrix_multiply_buf_matches_list_path(self) -> None:
+        """Test that the buffer entry point matches the list-based entry point."""
+        a: list[list[float]] = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+        b: list[list[float]] = [[7.0, 8.0, 9.0], [10.0, 11.0, 12.0]]
+
+        a_buf = array.array("d", [v for row in a for v in row])
+        b_buf = array.array("d", [v for row in b for v in row])
+
+        result_buf: list[float] = digits_calculator.matrix_multiply_buf(a_buf, b_buf, 3, 2, 3)
+        result_list: list[list[float]] = digits_calculator.matrix_multiply(a, b)
+
+        assert np.array_equal(result_buf, [v for row in result_list for v in row]), (
+            "Buffer path should match list path"
+        )
 
-    def test_matrix_multiply_identity_property(self) -> None:
+    def test_matrix_multiply_buf_wrong_length(self) -> None:
+        """Test that the buffer entry point rejects mismatched buffer lengths."""
+        a_buf = array.array("d", [1.0, 2.0, 3.0])
+        b_buf = array.array("d", [4.0, 5.0, 6.0, 7.0])
+
+        with pytest.raises(ValueError):
+            digits_calculator.matrix_multiply_buf(a_buf, b_buf, 2, 2, 2)
+
+    def test_matrix_multiply_random_against_reference(self) -> None:
+        """Cross-check the Rust kernel against the reference oracle on random matrices."""
+        rng = np.random.default_rng(42)
+        for m, k, n in [(3, 4, 5), (10, 10, 10), (17, 33, 9)]:
+            a = rng.standard_normal((m, k))
+            b = rng.standard_normal((k, n))
+
+            result: list[list[float]] = digits_calculator.matrix_multiply(a.tolist(), b.tolist())
+
+            assert np.allclose(result, matmul_ref(a, b), atol=1e-10), (
+                f"Rust result diverges from reference for shape ({m},{k})x({k},{n})"
+            )
+
+    @pytest.mark.parametrize("size", [32, 128, 512], ids=["32x32", "128x128", "512x512"])
+    def test_matrix_multiply_np_at_scale(
+        self, size: int, big_matrices: dict[int, tuple[np.ndarray, np.ndarray]]
+    ) -> None:
+        """Cross-check the ndarray entry point against NumPy on large matrices."""
+        a, b = big_matrices[size]
+        result = digits_calculator.matrix_multiply_np(a, b)
+        assert np.allclose(result, a @ b, atol=1e-9), (
+            f"Rust result diverges from NumPy at {size}x{size}"
+        )
+
+    def test_matrix_multiply_identity_property(self, mat_b_2x2: list[list[float]]) -> None:
         """Test that multiplying by identity matrix returns original matrix."""
         identity: list[list[float]] = [[1.0, 0.0], [0.0, 1.0]]
-        matrix: list[list[float]] = [[5.0, 6.0], [7.0, 8.0]]
 
-        result: list[list[float]] = digits_calculator.matrix_multiply(identity, matrix)
-        assert result == matrix, "Identity matrix multiplication failed"
+        result: list[list[float]] = digits_calculator.matrix_multiply(identity, mat_b_2x2)
+        assert np.array_equal(np.asarray(result), np.asarray(mat_b_2x2)), (
+            "Identity matrix multiplication failed"
+        )
 
 
 # ============================================================================
@@ -213,6 +414,15 @@ class TestSumAsString:
         result: str = digits_calculator.sum_as_string(a, b)
         assert result == expected, f"sum_as_string({a}, {b}) should return '{expected}'"
 
+    def test_sum_as_bytes_matches_sum_as_string(self) -> None:
+        """Test that the bytes entry point agrees with sum_as_string."""
+        for a, b in [(10, 20), (0, 0), (-5, 10), (2**50, 2**50)]:
+            result: bytes = digits_calculator.sum_as_bytes(a, b)
+            assert isinstance(result, bytes), "Result should be bytes"
+            assert result.decode("ascii") == digits_calculator.sum_as_string(a, b), (
+                f"sum_as_bytes({a}, {b}) should match sum_as_string"
+            )
+
     def test_sum_as_string_returns_string(self) -> None:
         """Test that sum_as_string always returns a string."""
         result: str = digits_calculator.sum_as_string(10, 20)
@@ -236,39 +446,46 @@ class TestSumAsString:
 # ============================================================================
 
 
+# Every function the extension is expected to export; keep in sync with
+# the pymodule registration in digits-calculator/src/lib.rs.
+_EXPECTED_EXPORTS: set[str] = {
+    "calculate_pi",
+    "calculate_pi_fast",
+    "matrix_multiply",
+    "matrix_multiply_shape",
+    "matrix_multiply_np",
+    "matrix_multiply_buf",
+    "divide",
+    "divide_batch",
+    "safe_sqrt",
+    "safe_sqrt_batch",
+    "factorial",
+    "factorial_many",
+    "sum_as_string",
+    "sum_as_bytes",
+}
+
+
 class TestModuleIntegration:
     """Test suite for module integration and attributes."""
 
-    @pytest.mark.parametrize(
-        "function_name",
-        [
-            "calculate_pi",
-            "matrix_multiply",
-            "divide",
-            "safe_sqrt",
-            "factorial",
-        ],
-    )
-    def test_module_exports_function(self, function_name: str) -> None:
-        """Test that module exports all expected functions."""
-        assert hasattr(digits_calculator, function_name), (
-            f"Module should have {function_name} function"
-        )
+    def test_module_exports_all_functions(self) -> None:
+        """Test that module exports all expected functions.
 
-    @pytest.mark.parametrize(
-        "function_name",
-        [
-            "calculate_pi",
-            "sum_as_string",
-            "divide",
-            "safe_sqrt",
-            "factorial",
-        ],
-    )
-    def test_exported_functions_are_callable(self, function_name: str) -> None:
+        One set difference reports every missing name at once instead of
+        one parametrized test item per export.
+        """
+        missing: set[str] = _EXPECTED_EXPORTS - set(dir(digits_calculator))
+        assert not missing, f"Module is missing exports: {sorted(missing)}"
+
+    def test_exported_functions_are_callable(self) -> None:
         """Test that all exported functions are callable."""
-        func = getattr(digits_calculator, function_name)
-        assert callable(func), f"{function_name} should be callable"
+        not_callable: list[str] = [
+            name
+            for name in sorted(_EXPECTED_EXPORTS)
+            if not callable(getattr(digits_calculator, name))
+        ]
+        assert not not_callable, f"Exports should be callable: {not_callable}"
 
 
 # ============================================================================
@@ -279,20 +496,41 @@ class TestModuleIntegration:
 class TestDivide:
     """Test suite for divide function with exception handling."""
 
-    @pytest.mark.parametrize(
-        "a,b,expected",
-        [
+    def test_divide_valid_operations(self) -> None:
+        """Test divide with various valid inputs, compared as one batch."""
+        cases: list[tuple[float, float, float]] = [
             (10.0, 2.0, 5.0),
             (7.0, 2.0, 3.5),
             (-10.0, 2.0, -5.0),
             (10.0, -2.0, -5.0),
             (-10.0, -2.0, 5.0),
-        ],
-    )
-    def test_divide_valid_operations(self, a: float, b: float, expected: float) -> None:
-        """Test divide with various valid inputs."""
-        result: float = digits_calculator.divide(a, b)
-        assert abs(result - expected) < 1e-10, f"divide({a}, {b}) should equal {expected}"
+        ]
+        results = np.array([digits_calculator.divide(a, b) for a, b, _ in cases])
+        expecteds = np.array([expected for _, _, expected in cases])
+        np.testing.assert_allclose(results, expecteds, atol=1e-10)
+
+    def test_divide_batch_matches_numpy(self) -> None:
+        """Test the batched entry point against NumPy's vectorized division."""
+        rng = np.random.default_rng(7)
+        a = rng.random(10_000) + 1.0
+        b = rng.random(10_000) + 1.0
+        np.testing.assert_allclose(digits_calculator.divide_batch(a, b), a / b)
+
+    def test_divide_batch_from_array_buffer(self) -> None:
+        """Test divide_batch fed from array.array storage without boxing.
+
+        np.frombuffer wraps the array's C double buffer in a zero-copy
+        view, so the values reach Rust without any per-element PyFloat
+        round-trip.
+        """
+        a = np.frombuffer(array.array("d", [10.0, 7.0, -10.0]))
+        b = np.frombuffer(array.array("d", [2.0, 2.0, 2.0]))
+        np.testing.assert_allclose(digits_calculator.divide_batch(a, b), [5.0, 3.5, -5.0])
+
+    def test_divide_batch_zero_raises_error(self) -> None:
+        """Test that a zero divisor anywhere in the batch raises ZeroDivisionError."""
+        with pytest.raises(ZeroDivisionError):
+            digits_calculator.divide_batch(np.array([1.0, 2.0]), np.array([1.0, 0.0]))
 
     def test_divide_by_zero_raises_error(self) -> None:
         """Test that division by zero raises ZeroDivisionError."""
@@ -301,28 +539,42 @@ class TestDivide:
 
     def test_divide_by_zero_message(self) -> None:
         """Test that division by zero error contains proper message."""
-        with pytest.raises(ZeroDivisionError, match="Division by Zero"):
+        with pytest.raises(ZeroDivisionError, match=_DIVZERO_RE):
             digits_calculator.divide(10.0, 0.0)
 
 
 class TestSafeSqrt:
     """Test suite for safe_sqrt function with exception handling."""
 
-    @pytest.mark.parametrize(
-        "x,expected",
-        [
+    def test_safe_sqrt_valid_inputs(self) -> None:
+        """Test safe_sqrt with valid positive inputs, compared as one batch."""
+        cases: list[tuple[float, float]] = [
             (0.0, 0.0),
             (1.0, 1.0),
             (4.0, 2.0),
             (9.0, 3.0),
             (16.0, 4.0),
-            (2.0, math.sqrt(2.0)),
-        ],
-    )
-    def test_safe_sqrt_valid_inputs(self, x: float, expected: float) -> None:
-        """Test safe_sqrt with valid positive inputs."""
-        result: float = digits_calculator.safe_sqrt(x)
-        assert abs(result - expected) < 1e-10, f"safe_sqrt({x}) should equal {expected}"
+            (2.0, _SQRT2),
+            (3.0, _SQRT3),
+        ]
+        results = np.array([digits_calculator.safe_sqrt(x) for x, _ in cases])
+        expecteds = np.array([expected for _, expected in cases])
+        np.testing.assert_allclose(results, expecteds, atol=1e-10)
+
+    def test_safe_sqrt_batch_matches_numpy(self) -> None:
+        """Test the batched entry point against NumPy's vectorized sqrt."""
+        arr = np.linspace(0.0, 1e6, 100_000)
+        np.testing.assert_allclose(digits_calculator.safe_sqrt_batch(arr), np.sqrt(arr))
+
+    def test_safe_sqrt_batch_from_array_buffer(self) -> None:
+        """Test safe_sqrt_batch fed from array.array storage without boxing."""
+        xs = np.frombuffer(array.array("d", [0.0, 1.0, 4.0, 9.0, 16.0]))
+        np.testing.assert_allclose(digits_calculator.safe_sqrt_batch(xs), [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_safe_sqrt_batch_negative_raises_error(self) -> None:
+        """Test that a negative value anywhere in the batch raises ValueError."""
+        with pytest.raises(ValueError):
+            digits_calculator.safe_sqrt_batch(np.array([4.0, -1.0]))
 
     def test_safe_sqrt_negative_raises_error(self) -> None:
         """Test that sqrt of negative number raises ValueError."""
@@ -331,30 +583,41 @@ class TestSafeSqrt:
 
     def test_safe_sqrt_negative_message(self) -> None:
         """Test that negative sqrt error contains proper message."""
-        with pytest.raises(ValueError, match="negative"):
+        with pytest.raises(ValueError, match=_NEG_RE):
             digits_calculator.safe_sqrt(-1.0)
 
 
+# Expected factorials generated from the standard library rather than
+# hard-coded literals. 20 is the largest input the Rust side accepts
+# before its u64 result type overflows, so the table stops there.
+_FACTORIAL_CASES: list[tuple[int, int]] = [(n, math.factorial(n)) for n in (0, 1, 2, 3, 5, 10, 20)]
+
+
 class TestFactorial:
     """Test suite for factorial function with exception handling."""
 
-    @pytest.mark.parametrize(
-        "n,expected",
-        [
-            (0, 1),
-            (1, 1),
-            (2, 2),
-            (3, 6),
-            (5, 120),
-            (10, 3628800),
-            (20, 2432902008176640000),
-        ],
-    )
+    @pytest.mark.parametrize("n,expected", _FACTORIAL_CASES)
     def test_factorial_valid_inputs(self, n: int, expected: int) -> None:
         """Test factorial with various valid inputs."""
-        result: int = digits_calculator.factorial(n)
+        result: int = _fact(n)
         assert result == expected, f"factorial({n}) should equal {expected}"
 
+    def test_factorial_many_matches_scalar(self) -> None:
+        """Test that the batched entry point matches per-value factorial calls."""
+        ns: list[int] = [0, 1, 5, 10, 20]
+        results: list[int] = digits_calculator.factorial_many(ns)
+        assert results == [_fact(n) for n in ns], "Batched factorials should match scalar calls"
+
+    def test_factorial_many_negative_raises_error(self) -> None:
+        """Test that a batch containing a negative value raises ValueError."""
+        with pytest.raises(ValueError):
+            digits_calculator.factorial_many([1, 2, -3])
+
+    def test_factorial_overflow_raises_error(self) -> None:
+        """Test that factorials beyond 20! (the u64 range) raise OverflowError."""
+        with pytest.raises(OverflowError):
+            digits_calculator.factorial(21)
+
     def test_factorial_negative_raises_error(self) -> None:
         """Test that factorial of negative number raises ValueError."""
         with pytest.raises(ValueError):
@@ -362,5 +625,5 @@ class TestFactorial:
 
     def test_factorial_negative_message(self) -> None:
         """Test that negative factorial error contains proper message."""
-        with pytest.raises(ValueError, match="negative"):
+        with pytest.raises(ValueError, match=_NEG_RE):
             digits_calculator.factorial(-1)
@@ -0,0 +1,42 @@
+"""
+Property-based tests for digits_calculator.
+
+Hypothesis generates random compatible matrix pairs and the results are
+cross-checked against the reference oracle, covering shapes and values
+the hand-written cases in test_digits_calculator.py never reach. The
+whole module skips cleanly when Hypothesis is not installed (it ships
+with the 'dev' extra).
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("hypothesis")
+
+import hypothesis.extra.numpy as hnp
+from _reference import matmul_ref
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+import digits_calculator
+
+# Bounded elements keep products well inside f64 range so the oracle
+# comparison is about algorithm correctness, not overflow behavior.
+_ELEMENTS = st.floats(min_value=-1e6, max_value=1e6, allow_nan=False)
+
+
+@given(data=st.data())
+@settings(max_examples=25, deadline=None)
+def test_matrix_multiply_matches_reference(data: st.DataObject) -> None:
+    """Rust matmul agrees with the oracle on random compatible pairs."""
+    m = data.draw(st.integers(min_value=1, max_value=6), label="m")
+    k = data.draw(st.integers(min_value=1, max_value=6), label="k")
+    n = data.draw(st.integers(min_value=1, max_value=6), label="n")
+    a = data.draw(hnp.arrays(np.float64, (m, k), elements=_ELEMENTS), label="a")
+    b = data.draw(hnp.arrays(np.float64, (k, n), elements=_ELEMENTS), label="b")
+
+    result: list[list[float]] = digits_calculator.matrix_multiply(a.tolist(), b.tolist())
+
+    assert np.allclose(result, matmul_ref(a, b), rtol=1e-12, atol=1e-6), (
+        f"Rust result diverges from reference for shape ({m},{k})x({k},{n})"
+    )